@@ -0,0 +1,56 @@
+class BaseAdmission():
+    """Virtual base class for Admission policies, deciding which keys read from the remote store
+    are worth writing to the local store
+
+    """
+
+    def __init__(self, **kwargs):
+        pass
+
+    def _record_proxy(self, key):
+        """Records an access to a key, Implementation Specific
+
+        Args:
+            key {String} -- The accessed key
+
+        Raises:
+            NotImplementedError: Virtual Methond, to be implemented in derived class
+        """
+        raise NotImplementedError()
+
+    def record(self, key):
+        """Records an access to a key
+
+        Args:
+            key {String} -- The accessed key
+
+        Returns:
+            Unknown -- Implementation specific of derived classes
+        """
+        return self._record_proxy(key)
+
+    def _admit_proxy(self, key, size, victim):
+        """Decides if a key has to be admitted in the cache, Implementation Specific
+
+        Args:
+            key {String} -- The candidate key
+            size {Int} -- The size in bytes of the candidate data
+            victim {String} -- The key the cache would evict to make room, None if no eviction
+
+        Raises:
+            NotImplementedError: Virtual Methond, to be implemented in derived class
+        """
+        raise NotImplementedError()
+
+    def admit(self, key, size=0, victim=None):
+        """Decides if a key has to be admitted in the cache
+
+        Args:
+            key {String} -- The candidate key
+            size {Int} -- The size in bytes of the candidate data. Defaults to 0
+            victim {String} -- The key the cache would evict to make room. Defaults to None
+
+        Returns:
+            Bool -- Whether the key has to be admitted or not
+        """
+        return self._admit_proxy(key, size, victim)
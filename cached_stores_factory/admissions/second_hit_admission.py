@@ -0,0 +1,39 @@
+from collections import OrderedDict
+from cached_stores_factory.admissions.base_admission import BaseAdmission
+
+
+class SecondHitAdmission(BaseAdmission):
+    """Implements "admit on second hit": a key is admitted only if it was already
+    accessed before, by means of a bounded history of recently seen keys
+
+    """
+
+    def __init__(self, **kwargs):
+        """**kwargs must include arg "history", an Int specifying how many keys are remembered
+        """
+        super(SecondHitAdmission, self).__init__()
+        self.history = kwargs.get('history', 1024)
+        self.seen = OrderedDict()
+
+    def _record_proxy(self, key):
+        """Counts an access to key in the history, forgetting the oldest keys
+
+        Args:
+            key (String): The accessed key
+        """
+        self.seen[key] = self.seen.pop(key, 0) + 1
+        while len(self.seen) > self.history:
+            self.seen.popitem(last=False)
+
+    def _admit_proxy(self, key, size, victim):
+        """Admits the key if it was accessed at least twice
+
+        Args:
+            key (String): The candidate key
+            size (Int): The size in bytes of the candidate data
+            victim (String): The key the cache would evict, None if no eviction
+
+        Returns:
+            Bool: Whether the key has to be admitted or not
+        """
+        return self.seen.get(key, 0) >= 2
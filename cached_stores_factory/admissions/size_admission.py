@@ -0,0 +1,43 @@
+import math
+import random
+from cached_stores_factory.admissions.base_admission import BaseAdmission
+
+
+class SizeAdmission(BaseAdmission):
+    """Implements a size aware admission: large objects are rejected, or admitted with a
+    probability decreasing with their size
+
+    """
+
+    def __init__(self, **kwargs):
+        """**kwargs may include "max_size", an Int specifying the largest admitted size in bytes,
+        and "scale", a Float: if given, keys are admitted with probability exp(-size / scale)
+        """
+        super(SizeAdmission, self).__init__()
+        self.max_size = kwargs.get('max_size')
+        self.scale = kwargs.get('scale')
+
+    def _record_proxy(self, key):
+        """Size admission does not track accesses
+
+        Args:
+            key (String): The accessed key
+        """
+        pass
+
+    def _admit_proxy(self, key, size, victim):
+        """Admits the key according to its size
+
+        Args:
+            key (String): The candidate key
+            size (Int): The size in bytes of the candidate data
+            victim (String): The key the cache would evict, None if no eviction
+
+        Returns:
+            Bool: Whether the key has to be admitted or not
+        """
+        if self.max_size is not None and size > self.max_size:
+            return False
+        if self.scale:
+            return random.random() < math.exp(-size / self.scale)
+        return True
@@ -0,0 +1,111 @@
+from cached_stores_factory.admissions.base_admission import BaseAdmission
+
+
+class CountMinSketch():
+    """Approximate frequency counter, by means of a Count-Min Sketch with periodic halving
+
+    """
+
+    def __init__(self, width=4096, depth=4, sample_size=None):
+        """CountMinSketch constructor
+
+        Args:
+            width (int, optional): number of counters per row. Defaults to 4096.
+            depth (int, optional): number of rows (hash functions). Defaults to 4.
+            sample_size (int, optional): number of increments after which all counters are halved.
+                Defaults to 10 * width.
+        """
+        self.width = width
+        self.depth = depth
+        self.sample_size = sample_size if sample_size is not None else 10 * width
+        self.rows = [[0] * width for _ in range(depth)]
+        self.additions = 0
+
+    def _indexes(self, key):
+        """Computes the counter index of key in each row, by double hashing
+
+        Args:
+            key (String): The key to hash
+
+        Returns:
+            List: one index per row
+        """
+        h1 = hash(key)
+        h2 = hash((key, self.depth)) | 1
+        return [(h1 + i * h2) % self.width for i in range(self.depth)]
+
+    def increment(self, key):
+        """Increments the estimated frequency of key
+
+        Args:
+            key (String): The key to count
+        """
+        for row, idx in zip(self.rows, self._indexes(key)):
+            row[idx] += 1
+        self.additions += 1
+        if self.additions >= self.sample_size:
+            self.reset()
+
+    def estimate(self, key):
+        """Estimates the frequency of key
+
+        Args:
+            key (String): The key to look up
+
+        Returns:
+            Int: The estimated frequency
+        """
+        return min(row[idx] for row, idx in zip(self.rows, self._indexes(key)))
+
+    def reset(self):
+        """Halves all counters, so that old frequencies fade out
+        """
+        for row in self.rows:
+            for idx, count in enumerate(row):
+                row[idx] = count >> 1
+        self.additions >>= 1
+
+
+class TinyLFUAdmission(BaseAdmission):
+    """Implements TinyLFU admission: a candidate is admitted only if it is accessed
+    more frequently than the key the cache would evict for it. When the cache evicts
+    nothing (a FIFOCache not yet full, or a TTLCache, which never returns a victim),
+    the candidate is admitted once its frequency reaches min_frequency
+
+    """
+
+    def __init__(self, **kwargs):
+        """**kwargs may include "width", "depth" and "sample_size" to tune the frequency sketch
+        (see CountMinSketch), and "min_frequency", an Int specifying the frequency required to
+        admit a key when the cache does not need to evict. Accesses are recorded before
+        admission, so the default of 2 rejects keys read only once
+        """
+        super(TinyLFUAdmission, self).__init__()
+        self.sketch = CountMinSketch(width=kwargs.get('width', 4096),
+                                     depth=kwargs.get('depth', 4),
+                                     sample_size=kwargs.get('sample_size'))
+        self.min_frequency = kwargs.get('min_frequency', 2)
+
+    def _record_proxy(self, key):
+        """Counts an access to key in the frequency sketch
+
+        Args:
+            key (String): The accessed key
+        """
+        self.sketch.increment(key)
+
+    def _admit_proxy(self, key, size, victim):
+        """Compares the frequency of the candidate with the one of the victim
+
+        Args:
+            key (String): The candidate key
+            size (Int): The size in bytes of the candidate data
+            victim (String): The key the cache would evict, None if no eviction
+
+        Returns:
+            Bool: Whether the key has to be admitted or not
+        """
+        frequency = self.sketch.estimate(key)
+        if victim is None:
+            return frequency >= self.min_frequency
+        return frequency > self.sketch.estimate(victim)
@@ -1,16 +1,17 @@
+from collections import OrderedDict
 from cached_stores_factory.caches.base_cache import BaseCache
 
 
 class FIFOCache(BaseCache):
-    """Implements a First In First Out Cache, by means of a simple Python list
+    """Implements a First In First Out Cache, by means of an insertion ordered Python Dictionary
 
     """
 
     def __init__(self, **kwargs):
         """**kwargs must include arg "size", an Int specifying the lenght of the FIFO
         """
-        super(FIFOCache, self).__init__()
-        self.fifo = []
+        super(FIFOCache, self).__init__(**kwargs)
+        self.fifo = OrderedDict()
         self.size = kwargs.get('size', 4)
         print('Fifo Cache with size: {0}'.format(self.size))
 
@@ -20,7 +21,7 @@ class FIFOCache(BaseCache):
         Args:
             key (String): The key to be cached 
         """
-        self.fifo.append(key)
+        self.fifo[key] = None
 
     def _check_proxy(self, key):
         """Checks if a key is cached
@@ -42,7 +43,7 @@ class FIFOCache(BaseCache):
         """
         deletable = []
         while len(self.fifo) > self.size:
-            deletable.append(self.fifo.pop(0))
+            deletable.append(self.fifo.popitem(last=False)[0])
         return deletable
 
     def _delete_from_cache_proxy(self, key):
@@ -51,9 +52,17 @@ class FIFOCache(BaseCache):
         Args:
             key (String): The key to remove from cache
         """
-        if key in self.fifo:
-            idx = self.fifo.index(key)
-            self.fifo.pop(idx)
+        self.fifo.pop(key, None)
+
+    def victim(self):
+        """Returns the key that would be evicted to make room for a new one
+
+        Returns:
+            String: The head of the FIFO if full, None otherwise
+        """
+        if self.fifo and len(self.fifo) >= self.size:
+            return next(iter(self.fifo))
+        return None
 
     def get_cache_status(self):
         """Returns info about the status of the cache
@@ -61,4 +70,4 @@ class FIFOCache(BaseCache):
         Returns:
             List: The FIFO list
         """
-        return self.fifo
+        return list(self.fifo)
@@ -1,4 +1,4 @@
-import datetime
+import time
 from cached_stores_factory.caches.base_cache import BaseCache
 
 
@@ -11,6 +11,7 @@ class TTLCache(BaseCache):
         """**kwargs must include arg "limit", 
         a Float specifying the duration of cache records in seconds
         """
+        super(TTLCache, self).__init__(**kwargs)
         self.limit = kwargs.get('limit', 60.0)
         self.kv = {}
 
@@ -20,10 +21,10 @@ class TTLCache(BaseCache):
         Args:
             key (String): The key to be cached 
         """
-        self.kv[key] = datetime.datetime.now().timestamp()
+        self.kv[key] = time.time()
 
     def _check_proxy(self, key):
-        """Checks if a key is cached
+        """Checks if a key is cached and not expired, even if not yet swept
 
         Args:
             key (String): The key to be looked up
@@ -32,10 +33,7 @@ class TTLCache(BaseCache):
             Bool: Whether the key was found or not in the cache
         """
         el = self.kv.get(key)
-        res = False
-        if el is not None:
-            res = True
-        return res
+        return el is not None and (time.time() - el) < self.limit
 
     def _check_expired_proxy(self):
         """Checks expired keys and cleans up cache
@@ -44,9 +42,9 @@ class TTLCache(BaseCache):
             List: a list of deletable keys
         """
         deletable = []
+        now = time.time()
         for key in self.kv:
             el = self.kv.get(key)
-            now = datetime.datetime.now().timestamp()
             if (now - el) >= self.limit:
                 deletable.append(key)
             else:
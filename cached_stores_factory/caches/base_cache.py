@@ -1,10 +1,38 @@
+import time
+from cached_stores_factory.caches.key_index import KeyIndex
+
+
 class BaseCache():
-    """Virtual base class for Caches, implementing common logic to various possible cache implementations
+    """Virtual base class for Caches, implementing common logic to various possible cache implementations.
+    Derived classes are not required to call this constructor: class level defaults apply
 
     """
 
+    sweep_interval = 1.0
+    _last_sweep = 0.0
+    indexing = True
+    _index = None
+
     def __init__(self, **kwargs):
-        pass
+        """**kwargs may include arg "sweep_interval", a Float specifying the minimum number of
+        seconds between two expiry sweeps triggered by lookups and deletions. Defaults to 1.0,
+        and arg "indexing", a Bool enabling the key index required by invalidate_prefix and
+        invalidate_tag. Defaults to True
+        """
+        self.sweep_interval = kwargs.get('sweep_interval', BaseCache.sweep_interval)
+        self._last_sweep = time.monotonic()
+        self.indexing = kwargs.get('indexing', BaseCache.indexing)
+
+    @property
+    def index(self):
+        """The index of cached keys by prefix and tag, built on first use
+
+        Returns:
+            KeyIndex -- The key index
+        """
+        if self._index is None:
+            self._index = KeyIndex()
+        return self._index
 
     def _add_to_cache_proxy(self, key):
         """Adds a key to the cache, Implementation Specific
@@ -17,17 +45,20 @@ class BaseCache():
         """
         raise NotImplementedError()
 
-    def add_to_cache(self, key):
+    def add_to_cache(self, key, tags=None):
         """Adds a key to the cache
 
         Args:
             key {String} -- The key to be cached
+            tags {Iterable} -- The tags to associate to key, for bulk invalidation. Defaults to None
 
         Returns:
             Unknown -- Implementation specific of derived classes
         """
         self.delete_from_cache(key)
         ret = self._add_to_cache_proxy(key)
+        if self.indexing:
+            self.index.add(key, tags)
         self.check_expired()
         return ret
 
@@ -51,7 +82,7 @@ class BaseCache():
         Returns:
             Bool -- Whether the key was found or not in the cache
         """
-        self.check_expired()
+        self._maybe_check_expired()
         return self._check_proxy(key)
 
     def _check_expired_proxy(self):
@@ -65,9 +96,24 @@ class BaseCache():
     def check_expired(self):
         """Checks expired keys and cleans up cache
         """
+        self._last_sweep = time.monotonic()
         deletable = self._check_expired_proxy()
+        if self.indexing:
+            for key in deletable:
+                self.index.discard(key)
         return deletable
 
+    def _maybe_check_expired(self):
+        """Checks expired keys and cleans up cache, if sweep_interval elapsed since last sweep.
+        Implementations must not report as cached keys which expired in between
+
+        Returns:
+            List -- a list of deletable keys, None if the sweep was skipped
+        """
+        if time.monotonic() - self._last_sweep < self.sweep_interval:
+            return None
+        return self.check_expired()
+
     def _delete_from_cache_proxy(self, key):
         """Deletes a key from cache, implelentations specific
 
@@ -88,9 +134,74 @@ class BaseCache():
         Returns:
             Unknown -- Implementation specific of derived classes
         """
-        self.check_expired()
+        self._maybe_check_expired()
+        if self.indexing:
+            self.index.discard(key)
         return self._delete_from_cache_proxy(key)
 
+    def tag(self, key, tags):
+        """Associates tags to a key already in the cache
+
+        Args:
+            key {String} -- The cached key
+            tags {Iterable} -- The tags to associate to key
+
+        Returns:
+            Bool -- Whether the key was found in the index and tagged
+        """
+        if not self.indexing or key not in self.index:
+            return False
+        self.index.add(key, tags)
+        return True
+
+    def invalidate_prefix(self, prefix):
+        """Deletes from cache all the keys starting with prefix
+
+        Args:
+            prefix {String} -- The prefix of the keys to remove from cache
+
+        Returns:
+            List -- The removed keys
+
+        Raises:
+            ValueError: If indexing is disabled
+        """
+        if not self.indexing:
+            raise ValueError('Prefix invalidation requires indexing')
+        keys = self.index.keys_with_prefix(prefix)
+        for key in keys:
+            self.index.discard(key)
+            self._delete_from_cache_proxy(key)
+        return keys
+
+    def invalidate_tag(self, tag):
+        """Deletes from cache all the keys associated to tag
+
+        Args:
+            tag {String} -- The tag of the keys to remove from cache
+
+        Returns:
+            List -- The removed keys
+
+        Raises:
+            ValueError: If indexing is disabled
+        """
+        if not self.indexing:
+            raise ValueError('Tag invalidation requires indexing')
+        keys = self.index.keys_with_tag(tag)
+        for key in keys:
+            self.index.discard(key)
+            self._delete_from_cache_proxy(key)
+        return keys
+
+    def victim(self):
+        """Returns the key that would be evicted to make room for a new one
+
+        Returns:
+            String -- The key to be evicted, None if adding a key evicts nothing
+        """
+        return None
+
     def get_cache_status(self):
         """Returns info about the status of the cache
 
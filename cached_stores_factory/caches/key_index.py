@@ -0,0 +1,102 @@
+import bisect
+import math
+
+
+class KeyIndex():
+    """Indexes cached keys by prefix and by tag (by means of a Python Dictionary of sets),
+    so that bulk invalidations do not scan all keys. Adding and removing keys is O(1):
+    new keys are collected in a pending list, kept apart from the sorted list used for prefix
+    lookups and merged into it once it grows past the square root of its size, while removed
+    keys are skipped until they outnumber the live ones
+
+    """
+
+    def __init__(self):
+        self.sorted_keys = []
+        self.tags = {}
+        self.key_tags = {}
+        self._pending = []
+        self._pending_sorted = True
+        self._stale = 0
+
+    def __contains__(self, key):
+        return key in self.key_tags
+
+    def add(self, key, tags=None):
+        """Adds a key to the index
+
+        Args:
+            key (String): The key to index
+            tags (Iterable, optional): The tags to associate to key. Defaults to None.
+        """
+        key_tags = self.key_tags.get(key)
+        if key_tags is None:
+            key_tags = self.key_tags[key] = set()
+            self._pending.append(key)
+            self._pending_sorted = False
+        for tag in tags or ():
+            key_tags.add(tag)
+            self.tags.setdefault(tag, set()).add(key)
+
+    def discard(self, key):
+        """Removes a key from the index, if present
+
+        Args:
+            key (String): The key to remove
+        """
+        key_tags = self.key_tags.pop(key, None)
+        if key_tags is None:
+            return
+        self._stale += 1
+        for tag in key_tags:
+            tagged = self.tags[tag]
+            tagged.discard(key)
+            if not tagged:
+                del self.tags[tag]
+
+    def _refresh(self):
+        """Prepares the sorted lists for a prefix lookup: rebuilds them if removed keys
+        outnumber the live ones, merges the pending keys if they grew too many,
+        sorts them otherwise
+        """
+        if self._stale > len(self.key_tags):
+            self.sorted_keys = sorted(self.key_tags)
+            self._pending = []
+            self._stale = 0
+        elif len(self._pending) > max(64, math.isqrt(len(self.sorted_keys))):
+            self._pending.sort()
+            self.sorted_keys = sorted(self.sorted_keys + self._pending)
+            self._pending = []
+        elif not self._pending_sorted:
+            self._pending.sort()
+        self._pending_sorted = True
+
+    def keys_with_prefix(self, prefix):
+        """Looks up the keys starting with prefix
+
+        Args:
+            prefix (String): The prefix to look up
+
+        Returns:
+            List: The matching keys
+        """
+        self._refresh()
+        keys = {}
+        for sorted_keys in (self.sorted_keys, self._pending):
+            idx = bisect.bisect_left(sorted_keys, prefix)
+            while idx < len(sorted_keys) and sorted_keys[idx].startswith(prefix):
+                if sorted_keys[idx] in self.key_tags:
+                    keys[sorted_keys[idx]] = None
+                idx += 1
+        return list(keys)
+
+    def keys_with_tag(self, tag):
+        """Looks up the keys associated to tag
+
+        Args:
+            tag (String): The tag to look up
+
+        Returns:
+            List: The matching keys
+        """
+        return list(self.tags.get(tag, ()))
@@ -0,0 +1,57 @@
+class BaseChannel():
+    """Virtual base class for coherence Channels, broadcasting invalidations among the nodes
+    sharing a remote store
+
+    """
+
+    def __init__(self, **kwargs):
+        pass
+
+    def _publish_proxy(self, message):
+        """Broadcasts a message, Implementation Specific
+
+        Args:
+            message {dict} -- The invalidation message
+
+        Raises:
+            NotImplementedError: Virtual Methond, to be implemented in derived class
+        """
+        raise NotImplementedError()
+
+    def publish(self, message):
+        """Broadcasts a message to the subscribers of the channel
+
+        Args:
+            message {dict} -- The invalidation message, with keys "op", "value" and "origin"
+
+        Returns:
+            Unknown -- Implementation specific of derived classes
+        """
+        return self._publish_proxy(message)
+
+    def _subscribe_proxy(self, callback):
+        """Registers a callback, Implementation Specific
+
+        Args:
+            callback {callable} -- The function invoked with each received message
+
+        Raises:
+            NotImplementedError: Virtual Methond, to be implemented in derived class
+        """
+        raise NotImplementedError()
+
+    def subscribe(self, callback):
+        """Registers a callback, invoked with each message broadcasted on the channel
+
+        Args:
+            callback {callable} -- The function invoked with each received message
+
+        Returns:
+            Unknown -- Implementation specific of derived classes
+        """
+        return self._subscribe_proxy(callback)
+
+    def close(self):
+        """Stops receiving messages
+        """
+        pass
@@ -0,0 +1,35 @@
+from cached_stores_factory.channels.base_channel import BaseChannel
+
+
+class LocalChannel(BaseChannel):
+    """Channel Class delivering messages in process, among the LocalChannel objects
+    sharing the same name. Useful to run several factories in a single process, e.g. in tests
+
+    """
+
+    _subscribers = {}
+
+    def __init__(self, **kwargs):
+        """LocalChannel constructor
+
+        Args:
+            **kwargs: arguments required to properly setup a local channel:
+                name, the label shared by the channels to connect. Defaults to "invalidations"
+        """
+        self.name = kwargs.get('name', 'invalidations')
+        self._callbacks = []
+
+    def _publish_proxy(self, message):
+        for callback in list(LocalChannel._subscribers.get(self.name, ())):
+            callback(dict(message))
+
+    def _subscribe_proxy(self, callback):
+        self._callbacks.append(callback)
+        LocalChannel._subscribers.setdefault(self.name, []).append(callback)
+
+    def close(self):
+        subscribers = LocalChannel._subscribers.get(self.name, [])
+        for callback in self._callbacks:
+            if callback in subscribers:
+                subscribers.remove(callback)
+        self._callbacks = []
@@ -0,0 +1,51 @@
+import json
+import redis
+from cached_stores_factory.channels.base_channel import BaseChannel
+
+
+class RedisChannel(BaseChannel):
+    """Channel Class based on Redis Pub/Sub
+
+    """
+
+    def __init__(self, host='localhost', port=6379, channel='cached_stores_factory:invalidations',
+                 sleep_time=0.01):
+        """RedisChannel constructor
+
+        Args:
+            host (String, optional): the redis host. Defaults to 'localhost'.
+            port (int, optional): the redis port. Defaults to 6379.
+            channel (String, optional): the redis pub/sub channel name.
+            sleep_time (float, optional): polling interval of the listener thread, in seconds.
+        """
+        self._conn = redis.Redis(host=host, port=port)
+        self._channel = channel
+        self._sleep_time = sleep_time
+        self._pubsub = None
+        self._thread = None
+        self._callbacks = []
+
+    def _publish_proxy(self, message):
+        return self._conn.publish(self._channel, json.dumps(message))
+
+    def _on_message(self, message):
+        payload = json.loads(message['data'])
+        for callback in self._callbacks:
+            callback(payload)
+
+    def _subscribe_proxy(self, callback):
+        self._callbacks.append(callback)
+        if self._pubsub is None:
+            self._pubsub = self._conn.pubsub(ignore_subscribe_messages=True)
+            self._pubsub.subscribe(**{self._channel: self._on_message})
+            self._thread = self._pubsub.run_in_thread(
+                sleep_time=self._sleep_time, daemon=True)
+
+    def close(self):
+        if self._thread is not None:
+            self._thread.stop()
+            self._thread = None
+        if self._pubsub is not None:
+            self._pubsub.close()
+            self._pubsub = None
+        self._callbacks = []
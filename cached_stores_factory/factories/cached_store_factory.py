@@ -1,3 +1,5 @@
+import uuid
+from collections import deque
 from cached_stores_factory.store_results.cached_store_result import CachedStoreResult
 from cached_stores_factory.stores.base_store import BaseStore
 
@@ -20,6 +22,8 @@ class CachedStoreFD():
 
     """
 
+    __slots__ = ('_target_factory', '_key')
+
     def __init__(self, key, target_factory):
         self._target_factory = target_factory
         self._key = key
@@ -36,7 +40,7 @@ class CachedStoreFD():
 
         res = self._target_factory.read(self._key, **kwargs)
         if isinstance(info, dict):
-            info.update(res.__dict__)
+            info.update(res.to_dict())
         return res.data
 
     def write(self, data, **kwargs):
@@ -73,19 +77,34 @@ class CachedStore():
         """
         return CachedStoreFD(key, self._target_factory)
 
+    def get(self, key):
+        """Reads a store element directly, without building a CachedStoreFD
+
+        Args:
+            key (String): the store element to read
+
+        Returns:
+            bytes: the store element data, None if not found
+        """
+        return self._target_factory.get(key)
+
 
 class CachedStoreFactory(BaseStore):
     """A Factory to compose custom cached Stores
 
     """
 
-    def __init__(self, local_store, remote_store, cache=None):
+    def __init__(self, local_store, remote_store, cache=None, admission=None, channel=None,
+                 recorder=None):
         """Factory construnctor
 
         Args:
             local_store: The Store object to use as local store
             remote_store: The Store objecy to use as remote store
             cache: The cache object to use, if desired
+            admission: The admission policy deciding which remote reads are cached, if desired
+            channel: The coherence channel broadcasting invalidations to other nodes, if desired
+            recorder: The TraceRecorder collecting read accesses, if desired
 
         Returns:
             CachedStoreFactory: A CachedStoreFactory isntance implementing the desired Cached Store
@@ -93,18 +112,26 @@ class CachedStoreFactory(BaseStore):
         self.local_store = local_store
         self.remote_store = remote_store
         self.cache = cache
-
-    def add_to_cache(self, key):
+        self.admission = admission
+        self.channel = channel
+        self.recorder = recorder
+        self.node_id = uuid.uuid4().hex
+        self._invalidations = deque()
+        if self.channel is not None:
+            self.channel.subscribe(self._on_invalidation)
+
+    def add_to_cache(self, key, tags=None):
         """Adds a key to the explicit cache, if defined
 
         Args:
             key (String): The key to add to the explicit cache
+            tags (Iterable, optional): The tags to associate to key. Defaults to None.
 
         Returns:
             n/a: implementation dependent
         """
         if self.cache is not None:
-            return self.cache.add_to_cache(key)
+            return self.cache.add_to_cache(key, tags)
         return None
 
     def check(self, key):
@@ -133,19 +160,50 @@ class CachedStoreFactory(BaseStore):
             return self.cache.delete_from_cache(key)
         return None
 
-    def _push_to_cache(self, key, data, **kwargs):
+    def tag(self, key, tags):
+        """Associates tags to a key already in the explicit cache, if defined
+
+        Args:
+            key (String): the cached key
+            tags (Iterable): the tags to associate to key
+
+        Returns:
+            bool: Whether the key was tagged
+        """
+        if self.cache is not None and tags:
+            return self.cache.tag(key, tags)
+        return False
+
+    def admit(self, key, data):
+        """Asks the admission policy, if defined, whether a remote read has to be cached
+
+        Args:
+            key (String): the candidate key
+            data (bytes): the data read from remote store for key
+
+        Returns:
+            bool: Whether the key has to be pushed to cache
+        """
+        if self.admission is None:
+            return True
+        victim = self.cache.victim() if self.cache is not None else None
+        size = len(data) if data is not None else 0
+        return self.admission.admit(key, size, victim)
+
+    def _push_to_cache(self, key, data, tags=None, **kwargs):
         """Add key entry to cache
 
         Args:
             key (String): the key to persist in cache
             data (bytes): the data corresponding to key
+            tags (Iterable, optional): the tags to associate to key. Defaults to None.
 
         Returns:
             [type]: [description]
         """
         local_res = self.local_store.write(key, data, **kwargs)
         if local_res.success:
-            self.add_to_cache(key)
+            self.add_to_cache(key, tags)
             local_res = self.local_store.read(key)
             if not local_res.success:
                 print('Local Store save failed: {0}'.format(
@@ -155,6 +213,26 @@ class CachedStoreFactory(BaseStore):
                 local_res.error))
         return local_res
 
+    def _fetch(self, key, drop_stale=False, **kwargs):
+        """Reads record from remote store, pushing it to cache if admitted
+
+        Args:
+            key (String): the key to read from remote store
+            drop_stale (bool, optional): if the key may still be cached, as when updating,
+                so that a rejected read drops the outdated local copy. Defaults to False.
+
+        Returns:
+            StoreResult: Operation result
+        """
+        res = self.remote_store.read(key)
+        if res.success:
+            if self.admit(key, res.data):
+                res = self._push_to_cache(key, res.data, **kwargs)
+            elif drop_stale and self.check(key):
+                self.delete_from_cache(key)
+                self.local_store.delete(key)
+        return res
+
     def _read_proxy(self, key, update=False, **kwargs):
         """Reads record from cached store 
 
@@ -165,38 +243,74 @@ class CachedStoreFactory(BaseStore):
         Returns:
             CachedStoreResult: Operation result
         """
+        if self._invalidations:
+            self._apply_invalidations()
+        if self.admission is not None:
+            self.admission.record(key)
         in_cache = False if update else self.check(key)
         if in_cache:
             res = self.local_store.read(key)
-            if not res.success:
+            if res.success:
+                self.tag(key, kwargs.get('tags'))
+            else:
                 in_cache = False
                 print(
                     'Local file not found ({0}), falling back to remote!'.format(res.error))
-                res = self.remote_store.read(key)
                 self.delete_from_cache(key)
-                if res.success:
-                    res = self._push_to_cache(key, res.data, **kwargs)
+                res = self._fetch(key, **kwargs)
         else:
-            res = self.remote_store.read(key,)
-            if res.success:
-                res = self._push_to_cache(key, res.data, **kwargs)
+            res = self._fetch(key, drop_stale=update, **kwargs)
 
+        if self.recorder is not None:
+            self.recorder.record(key, len(res.data) if res.data is not None else 0, in_cache)
         return CachedStoreResult(res, in_cache)
 
-    def _write_proxy(self, key, data, **kwargs):
+    def get(self, key, **kwargs):
+        """Fast read of record from cached store: on a hit, data is returned straight
+        from the local store, without building Operation Results
+
+        Args:
+            key (String): the key to lookup in cached store
+
+        Returns:
+            bytes: the record data, None if the read failed
+        """
+        if self._invalidations:
+            self._apply_invalidations()
+        if self.admission is not None:
+            self.admission.record(key)
+        if self.check(key):
+            data = self.local_store.get(key)
+            if data is not None:
+                if kwargs:
+                    self.tag(key, kwargs.get('tags'))
+                if self.recorder is not None:
+                    self.recorder.record(key, len(data), True)
+                return data
+            self.delete_from_cache(key)
+        res = self._fetch(key, **kwargs)
+        if self.recorder is not None:
+            self.recorder.record(key, len(res.data) if res.data is not None else 0, False)
+        return res.data if res.success else None
+
+    def _write_proxy(self, key, data, tags=None, **kwargs):
         """Writes record to cached store
 
         Args:
             key (String): the key to write in cached store
             data (bytes): the data to write in cache store for key
+            tags (Iterable, optional): the tags to associate to key. Defaults to None.
 
         Returns:
             CachedStoreResult: Operation result
         """
+        if self._invalidations:
+            self._apply_invalidations()
         res = self.remote_store.write(key, data, **kwargs)
         print(res.success)
         if res.success:
-            res = self._push_to_cache(key, data, **kwargs)
+            self._publish('key', key)
+            res = self._push_to_cache(key, data, tags, **kwargs)
         return CachedStoreResult(res, False)
 
     def _delete_proxy(self, key):
@@ -211,12 +325,114 @@ class CachedStoreFactory(BaseStore):
         self.delete_from_cache(key)
         remote_res = self.remote_store.delete(key)
         local_res = self.local_store.delete(key)
+        self._publish('key', key)
         if not remote_res.success:
             return CachedStoreResult(remote_res, False)
         if not local_res.success:
             return CachedStoreResult(local_res, False)
         return CachedStoreResult(remote_res, False)
 
+    def _invalidate_local(self, op, value):
+        """Drops stale entries from the local tier, without broadcasting
+
+        Args:
+            op (String): the kind of invalidation, among "key", "prefix" and "tag"
+            value (String): the key, prefix or tag to invalidate
+
+        Returns:
+            List: the invalidated keys
+        """
+        if op == 'key':
+            if self.cache is None:
+                return [value] if self.local_store.delete(value).success else []
+            else:
+                if self.cache.indexing:
+                    keys = [value] if value in self.cache.index else []
+                else:
+                    keys = [value] if self.cache.check(value) else []
+                self.cache.delete_from_cache(value)
+        elif self.cache is None or not self.cache.indexing:
+            print('Bulk invalidation requires an indexing cache, ignoring {0} {1}'.format(op, value))
+            keys = []
+        elif op == 'prefix':
+            keys = self.cache.invalidate_prefix(value)
+        elif op == 'tag':
+            keys = self.cache.invalidate_tag(value)
+        else:
+            raise ValueError('Unknown invalidation: {0}'.format(op))
+        for key in keys:
+            self.local_store.delete(key)
+        return keys
+
+    def _publish(self, op, value):
+        """Broadcasts an invalidation on the coherence channel, if defined
+
+        Args:
+            op (String): the kind of invalidation, among "key", "prefix" and "tag"
+            value (String): the key, prefix or tag to invalidate
+        """
+        if self.channel is not None:
+            self.channel.publish(
+                {'op': op, 'value': value, 'origin': self.node_id})
+
+    def _on_invalidation(self, message):
+        """Queues an invalidation received from the coherence channel. Invalidations are
+        applied by the next operation on the factory, in the thread of the caller
+
+        Args:
+            message (dict): the invalidation message
+        """
+        if message.get('origin') != self.node_id:
+            self._invalidations.append((message['op'], message['value']))
+
+    def _apply_invalidations(self):
+        """Applies the invalidations received from the coherence channel
+        """
+        while self._invalidations:
+            op, value = self._invalidations.popleft()
+            self._invalidate_local(op, value)
+
+    def invalidate(self, key):
+        """Drops key from the local tier of every node, leaving the remote store untouched
+
+        Args:
+            key (String): the key to invalidate
+
+        Returns:
+            List: the keys invalidated on this node
+        """
+        keys = self._invalidate_local('key', key)
+        self._publish('key', key)
+        return keys
+
+    def invalidate_prefix(self, prefix):
+        """Drops all the keys starting with prefix from the local tier of every node,
+        leaving the remote store untouched
+
+        Args:
+            prefix (String): the prefix of the keys to invalidate
+
+        Returns:
+            List: the keys invalidated on this node
+        """
+        keys = self._invalidate_local('prefix', prefix)
+        self._publish('prefix', prefix)
+        return keys
+
+    def invalidate_tag(self, tag):
+        """Drops all the keys associated to tag from the local tier of every node,
+        leaving the remote store untouched
+
+        Args:
+            tag (String): the tag of the keys to invalidate
+
+        Returns:
+            List: the keys invalidated on this node
+        """
+        keys = self._invalidate_local('tag', tag)
+        self._publish('tag', tag)
+        return keys
+
     def build(self):
         """Build the desired CachedStore
 
@@ -0,0 +1,192 @@
+import numpy as np
+
+
+class CacheSimulator():
+    """Replays an access trace against the cache policies, to size them offline.
+    For each policy and capacity, reports hit ratio, byte hit ratio and the estimated
+    cost of the remote store accesses (misses)
+
+    """
+
+    def __init__(self, trace, request_cost=1.0, byte_cost=0.0):
+        """CacheSimulator constructor
+
+        Args:
+            trace (TraceRecorder or dict): the trace to replay, or a dict of arrays
+                "keys", "sizes" and "timestamps", as returned by TraceRecorder.to_arrays
+            request_cost (float, optional): the cost of a remote read. Defaults to 1.0.
+            byte_cost (float, optional): the cost of a byte read from remote. Defaults to 0.0.
+        """
+        arrays = trace.to_arrays() if hasattr(trace, 'to_arrays') else trace
+        _, self.keys = np.unique(np.asarray(arrays['keys']), return_inverse=True)
+        self.keys = self.keys.astype(np.int64)
+        self.sizes = np.asarray(arrays['sizes'], dtype=np.int64)
+        self.timestamps = np.asarray(arrays['timestamps'], dtype=np.float64)
+        self.recorded_hits = np.asarray(arrays['hits'], dtype=bool) if 'hits' in arrays else None
+        self.request_cost = request_cost
+        self.byte_cost = byte_cost
+        self.n_keys = int(self.keys.max()) + 1 if len(self.keys) else 0
+        self._sorted = None
+
+    def _summary(self, hits):
+        """Computes the metrics of a replay
+
+        Args:
+            hits (numpy.ndarray): a boolean array, True where the access was a hit
+
+        Returns:
+            dict: "hit_ratio", "byte_hit_ratio" and "remote_cost"
+        """
+        total = len(hits)
+        total_bytes = int(self.sizes.sum())
+        hit_bytes = int(self.sizes[hits].sum())
+        misses = total - int(hits.sum())
+        return {'hit_ratio': float(hits.sum()) / total if total else 0.0,
+                'byte_hit_ratio': float(hit_bytes) / total_bytes if total_bytes else 0.0,
+                'remote_cost': misses * self.request_cost +
+                float(total_bytes - hit_bytes) * self.byte_cost}
+
+    def _curve(self, capacities, replay):
+        """Replays the trace for each capacity, collecting the metrics in arrays
+
+        Args:
+            capacities (Iterable): the capacities to simulate
+            replay (callable): the function returning the hits array for a capacity
+
+        Returns:
+            dict: arrays "capacity", "hit_ratio", "byte_hit_ratio" and "remote_cost"
+        """
+        capacities = list(capacities)
+        summaries = [self._summary(replay(capacity)) for capacity in capacities]
+        curve = {'capacity': np.asarray(capacities)}
+        for metric in ('hit_ratio', 'byte_hit_ratio', 'remote_cost'):
+            curve[metric] = np.array([summary[metric] for summary in summaries])
+        return curve
+
+    def fifo_hits(self, size):
+        """Replays the trace against a FIFOCache. FIFO is not a stack policy, so each size is
+        replayed on its own: a key is a hit if less than size keys were inserted after it
+
+        Args:
+            size (Int): the FIFO size
+
+        Returns:
+            numpy.ndarray: a boolean array, True where the access was a hit
+        """
+        last = [-size - 1] * self.n_keys
+        hits = bytearray(len(self.keys))
+        inserted = 0
+        for idx, key in enumerate(self.keys.tolist()):
+            if inserted - last[key] <= size:
+                hits[idx] = 1
+            else:
+                last[key] = inserted
+                inserted += 1
+        return np.frombuffer(bytes(hits), dtype=np.uint8).astype(bool)
+
+    def ttl_hits(self, limit):
+        """Replays the trace against a TTLCache, vectorized over the keys: accesses are
+        sorted by key and time, the next miss of each access is found by binary search
+        and misses are followed from the first access of each key
+
+        Args:
+            limit (float): the TTL in seconds, a limit <= 0 makes every access a miss
+
+        Returns:
+            numpy.ndarray: a boolean array, True where the access was a hit
+        """
+        n = len(self.keys)
+        if not n or limit <= 0:
+            return np.zeros(n, dtype=bool)
+        if self._sorted is None:
+            order = np.lexsort((self.timestamps, self.keys))
+            keys = self.keys[order]
+            times = self.timestamps[order]
+            starts = np.r_[True, keys[1:] != keys[:-1]]
+            start_idx = np.flatnonzero(starts)
+            group_end = np.r_[start_idx[1:], n][np.cumsum(starts) - 1]
+            span = times.max() - times.min()
+            self._sorted = (order, times - times.min(), start_idx, group_end, keys, span)
+        order, times, start_idx, group_end, keys, span = self._sorted
+        # Spreads key groups far enough apart that a search never crosses a group
+        offsets = times + keys * (span + limit + 1.0)
+        next_miss = np.searchsorted(offsets, offsets + limit, side='left')
+        misses = np.zeros(n, dtype=bool)
+        frontier = start_idx
+        while frontier.size:
+            misses[frontier] = True
+            nxt = next_miss[frontier]
+            frontier = nxt[(nxt > frontier) & (nxt < group_end[frontier])]
+        hits = np.empty(n, dtype=bool)
+        hits[order] = ~misses
+        return hits
+
+    def infinite_hits(self):
+        """Replays the trace against an unbounded cache: only the first access of a key misses
+
+        Returns:
+            numpy.ndarray: a boolean array, True where the access was a hit
+        """
+        hits = np.ones(len(self.keys), dtype=bool)
+        _, first = np.unique(self.keys, return_index=True)
+        hits[first] = False
+        return hits
+
+    def cache_hits(self, cache):
+        """Replays the trace against any BaseCache, through its public interface.
+        Slower than the dedicated replays, and only meaningful for policies not depending
+        on wall clock time
+
+        Args:
+            cache (BaseCache): the cache to replay the trace against
+
+        Returns:
+            numpy.ndarray: a boolean array, True where the access was a hit
+        """
+        hits = np.zeros(len(self.keys), dtype=bool)
+        for idx, key in enumerate(self.keys.tolist()):
+            if cache.check(key):
+                hits[idx] = True
+            else:
+                cache.add_to_cache(key)
+        return hits
+
+    def simulate_fifo(self, sizes):
+        """Computes the FIFOCache curve
+
+        Args:
+            sizes (Iterable): the FIFO sizes to simulate
+
+        Returns:
+            dict: arrays "capacity", "hit_ratio", "byte_hit_ratio" and "remote_cost"
+        """
+        return self._curve(sizes, self.fifo_hits)
+
+    def simulate_ttl(self, limits):
+        """Computes the TTLCache curve
+
+        Args:
+            limits (Iterable): the TTLs in seconds to simulate
+
+        Returns:
+            dict: arrays "capacity", "hit_ratio", "byte_hit_ratio" and "remote_cost"
+        """
+        return self._curve(limits, self.ttl_hits)
+
+    def simulate(self, fifo_sizes=(), ttl_limits=()):
+        """Computes the curves of all the cache policies, along with the unbounded cache
+        and, if available, the recorded behaviour
+
+        Args:
+            fifo_sizes (Iterable, optional): the FIFO sizes to simulate. Defaults to ().
+            ttl_limits (Iterable, optional): the TTLs in seconds to simulate. Defaults to ().
+
+        Returns:
+            dict: the results, by policy name
+        """
+        results = {'FIFOCache': self.simulate_fifo(fifo_sizes),
+                   'TTLCache': self.simulate_ttl(ttl_limits),
+                   'infinite': self._summary(self.infinite_hits())}
+        if self.recorded_hits is not None:
+            results['recorded'] = self._summary(self.recorded_hits)
+        return results
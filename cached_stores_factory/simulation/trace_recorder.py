@@ -0,0 +1,81 @@
+import time
+from array import array
+import numpy as np
+
+
+class TraceRecorder():
+    """Records the read accesses of a CachedStoreFactory, to be replayed by CacheSimulator.
+    Keys are interned into Int ids and events appended to compact arrays, to keep the
+    overhead on the read path negligible
+
+    """
+
+    def __init__(self):
+        self.key_ids = {}
+        self.key_names = []
+        self.keys = array('q')
+        self.sizes = array('q')
+        self.hits = array('b')
+        self.timestamps = array('d')
+
+    def record(self, key, size, hit):
+        """Records an access
+
+        Args:
+            key (String): the accessed key
+            size (Int): the size in bytes of the data read
+            hit (Bool): whether the key was served by the local store
+        """
+        key_id = self.key_ids.get(key)
+        if key_id is None:
+            key_id = self.key_ids[key] = len(self.key_names)
+            self.key_names.append(key)
+        self.keys.append(key_id)
+        self.sizes.append(size)
+        self.hits.append(hit)
+        self.timestamps.append(time.time())
+
+    def __len__(self):
+        return len(self.keys)
+
+    def to_arrays(self):
+        """Returns the trace as NumPy arrays
+
+        Returns:
+            dict: arrays "keys" (key ids), "sizes", "hits" and "timestamps"
+        """
+        return {'keys': np.frombuffer(self.keys, dtype=np.int64).copy(),
+                'sizes': np.frombuffer(self.sizes, dtype=np.int64).copy(),
+                'hits': np.frombuffer(self.hits, dtype=np.int8).astype(bool),
+                'timestamps': np.frombuffer(self.timestamps, dtype=np.float64).copy()}
+
+    def save(self, path):
+        """Saves the trace to a .npz file
+
+        Args:
+            path (String): the destination file
+        """
+        np.savez_compressed(path, key_names=np.array(self.key_names, dtype=object),
+                            **self.to_arrays())
+
+    @classmethod
+    def load(cls, path):
+        """Loads a trace saved by TraceRecorder.save
+
+        Args:
+            path (String): the source file
+
+        Returns:
+            TraceRecorder: the loaded trace
+        """
+        recorder = cls()
+        with np.load(path, allow_pickle=True) as npz:
+            recorder.key_names = npz['key_names'].tolist()
+            recorder.keys.frombytes(npz['keys'].astype(np.int64).tobytes())
+            recorder.sizes.frombytes(npz['sizes'].astype(np.int64).tobytes())
+            recorder.hits.frombytes(npz['hits'].astype(np.int8).tobytes())
+            recorder.timestamps.frombytes(
+                npz['timestamps'].astype(np.float64).tobytes())
+        recorder.key_ids = {key: idx for idx,
+                            key in enumerate(recorder.key_names)}
+        return recorder
@@ -6,6 +6,8 @@ class CachedStoreResult(StoreResult):
 
     """
 
+    __slots__ = ('cached',)
+
     def __init__(self, store_result, cached=False):
         """CachedStoreResult constructor
 
@@ -13,6 +15,7 @@ class CachedStoreResult(StoreResult):
             store_result (StoreResult): the reference store operation result
             cached (bool, optional): if the operation target was in the cache. Defaults to False.
         """
-        super().__init__(success=store_result.success, error=store_result.error,
-                         data=store_result.data)
+        self.success = store_result.success
+        self.error = store_result.error
+        self.data = store_result.data
         self.cached = cached
@@ -3,6 +3,8 @@ class StoreResult():
 
     """
 
+    __slots__ = ('success', 'error', 'data')
+
     def __init__(self, success=False, error=None, data=None):
         """StoreResult constructor
 
@@ -16,6 +18,15 @@ class StoreResult():
         self.error = error
         self.data = data
 
+    def to_dict(self):
+        """Returns the operation result fields
+
+        Returns:
+            dict: the fields of the result
+        """
+        return {name: getattr(self, name) for cls in type(self).__mro__
+                for name in getattr(cls, '__slots__', ())}
+
     def read(self):
         """Reads Data, to be Used as FD
 
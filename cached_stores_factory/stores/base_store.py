@@ -28,6 +28,18 @@ class BaseStore():
             res = StoreResult(success=False, error=e)
         return res
 
+    def get(self, key):
+        """Fast read of data from Store, without building an Operation Result
+
+        Args:
+            key (String): the key to read in the store
+
+        Returns:
+            bytes: the data read from store, None if the read failed
+        """
+        res = self.read(key)
+        return res.data if res.success else None
+
     def _write_proxy(self, key, data, **kwargs):
         raise NotImplementedError()
 
@@ -24,6 +24,9 @@ class DictStore(BaseStore):
         res = StoreResult(success=(data is not None), data=data)
         return res
 
+    def get(self, key):
+        return self.store_dict.get(key)
+
     def _write_proxy(self, key, data, **kwargs):
         self.store_dict[key] = data
         res = StoreResult(success=True)
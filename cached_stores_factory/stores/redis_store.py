@@ -27,6 +27,12 @@ class RedisStore(BaseStore):
         res = StoreResult(success=(data is not None), data=data)
         return res
 
+    def get(self, key):
+        try:
+            return self._conn.get(key)
+        except redis.exceptions.RedisError:
+            return None
+
     def _write_proxy(self, key, data, **kwargs):
         ex = kwargs.get('ex', self._ex)
         self._conn.set(key, data, ex=ex)
@@ -1,42 +1,259 @@
 import io
 import os
+import hashlib
 import tempfile
 from cached_stores_factory.stores.base_store import BaseStore
 from cached_stores_factory.store_results.store_result import StoreResult
 
+_fdatasync = getattr(os, 'fdatasync', os.fsync)
+
+
 class TempfileStore(BaseStore):
-    """Store Class based on Temporary Files 
+    """Store Class based on Temporary Files
 
     """
 
+    SYNC_MODES = ('none', 'fdatasync', 'batch')
+
     def __init__(self, **kwargs):
         """TempfileStore constructor
 
         Args:
-            **kwargs: arguments required to properly setup a temporary file store: 
+            **kwargs: arguments required to properly setup a temporary file store:
                 target, a directory inside the system's /tmp where the temporary files are saved
+                shard_depth, an Int, number of hashed directory levels keys are spread over.
+                    Defaults to 0 (keys are saved verbatim as bucketdir/key)
+                shard_width, an Int, number of hex digits of the key hash per directory level.
+                    Defaults to 2 (256 subdirectories per level)
+                pack_threshold, an Int, objects up to this size in bytes are packed into
+                    segment files instead of separate files. Defaults to 0 (no packing)
+                segment_size, an Int, size in bytes after which a new segment file is started.
+                    Defaults to 64MB
+                compact_ratio, a Float, fraction of overwritten or deleted bytes in a sealed
+                    segment after which its live objects are copied to the current segment and
+                    the file removed. The current segment is checked once it rolls over, so dead
+                    bytes are bounded by segment_size plus compact_ratio of the sealed ones.
+                    Defaults to 0.5
+                sync, a String among 'none', 'fdatasync' and 'batch'. Defaults to 'none'
+                sync_batch, an Int, number of writes between syncs in 'batch' mode. Defaults to 64
         """
         self.bucketdir = tempfile.TemporaryDirectory(
             prefix='{0}_'.format(kwargs.get('target')))
+        self.shard_depth = kwargs.get('shard_depth', 0)
+        self.shard_width = kwargs.get('shard_width', 2)
+        self.pack_threshold = kwargs.get('pack_threshold', 0)
+        self.segment_size = kwargs.get('segment_size', 64 * 1024 * 1024)
+        self.compact_ratio = kwargs.get('compact_ratio', 0.5)
+        self.sync = kwargs.get('sync', 'none')
+        self.sync_batch = kwargs.get('sync_batch', 64)
+        if self.sync not in self.SYNC_MODES:
+            raise ValueError('Unknown sync mode: {0}'.format(self.sync))
+        self._dirs = set([self.bucketdir.name])
+        self._segment_index = {}
+        self._segment_keys = {}
+        self._segment_bytes = {}
+        self._segment_dead = {}
+        self._segment_fd = None
+        self._segment_path = None
+        self._segment_count = 0
+        self._pending_sync = set()
+        self._unsynced_writes = 0
+
+    def _filepath(self, key):
+        """Maps a key to its file path, according to the sharding configuration
+
+        Args:
+            key (String): the key to map
+
+        Returns:
+            String: the path of the file holding key
+        """
+        if self.shard_depth <= 0:
+            return '{0}/{1}'.format(self.bucketdir.name, key)
+        digest = hashlib.sha1(key.encode()).hexdigest()
+        width = self.shard_width
+        shards = [digest[i * width:(i + 1) * width]
+                  for i in range(self.shard_depth)]
+        return '{0}/{1}/{2}'.format(self.bucketdir.name, '/'.join(shards), digest)
+
+    def _makedirs(self, dirpath):
+        """Creates dirpath, unless it is already known to exist
+
+        Args:
+            dirpath (String): the directory to create
+        """
+        if dirpath not in self._dirs:
+            os.makedirs(dirpath, exist_ok=True)
+            self._dirs.add(dirpath)
+
+    def _sync_fd(self, fd):
+        """Applies the configured durability mode after a write on fd
+
+        Args:
+            fd (file): the file object just written
+        """
+        if self.sync == 'fdatasync':
+            fd.flush()
+            _fdatasync(fd.fileno())
+        elif self.sync == 'batch':
+            fd.flush()
+            self._pending_sync.add(fd.name)
+            self._unsynced_writes += 1
+            if self._unsynced_writes >= self.sync_batch:
+                self.flush()
+
+    def flush(self):
+        """Syncs to disk all the files written since last sync
+        """
+        if self._segment_fd is not None:
+            self._segment_fd.flush()
+        pending = self._pending_sync
+        self._pending_sync = set()
+        self._unsynced_writes = 0
+        for path in pending:
+            try:
+                fd = os.open(path, os.O_RDONLY)
+            except FileNotFoundError:
+                continue
+            try:
+                _fdatasync(fd)
+            finally:
+                os.close(fd)
+
+    def _open_segment(self):
+        """Starts a new segment file, closing the current one
+        """
+        if self._segment_fd is not None:
+            self._segment_fd.close()
+        self._segment_count += 1
+        segdir = '{0}/segments'.format(self.bucketdir.name)
+        self._makedirs(segdir)
+        self._segment_path = '{0}/{1:08d}.seg'.format(
+            segdir, self._segment_count)
+        self._segment_fd = open(self._segment_path, 'ab')
+        self._segment_keys[self._segment_path] = set()
+        self._segment_bytes[self._segment_path] = 0
+        self._segment_dead[self._segment_path] = 0
+
+    def _append_segment(self, key, data):
+        """Appends data to the current segment file and indexes it
+
+        Args:
+            key (String): the key to write
+            data (bytes): the data to write at key
+        """
+        sealed = None
+        if self._segment_fd is None or self._segment_fd.tell() + len(data) > self.segment_size:
+            sealed = self._segment_path
+            self._open_segment()
+        offset = self._segment_fd.tell()
+        self._segment_fd.write(data)
+        self._segment_index[key] = (self._segment_path, offset, len(data))
+        self._segment_keys[self._segment_path].add(key)
+        self._segment_bytes[self._segment_path] += len(data)
+        if self.sync == 'none':
+            self._segment_fd.flush()
+        else:
+            self._sync_fd(self._segment_fd)
+        self._maybe_compact(sealed)
+
+    def _discard_packed(self, key):
+        """Removes a packed key from the segment index, accounting its bytes as dead
+
+        Args:
+            key (String): the key to remove
+
+        Returns:
+            String: the segment which held key, None if key was not packed
+        """
+        packed = self._segment_index.pop(key, None)
+        if packed is None:
+            return None
+        path, offset, length = packed
+        self._segment_keys[path].discard(key)
+        self._segment_dead[path] += length
+        return path
+
+    def _maybe_compact(self, path):
+        """Compacts a sealed segment if its dead bytes ratio reached compact_ratio: its live
+        objects are appended to the current segment, and the segment file removed.
+        The current segment is never compacted, to avoid churning segment files
+
+        Args:
+            path (String): the segment to check
+        """
+        if path is None or path == self._segment_path or path not in self._segment_bytes:
+            return
+        total = self._segment_bytes[path]
+        if total == 0 or self._segment_dead[path] < self.compact_ratio * total:
+            return
+        keys = self._segment_keys.pop(path)
+        fd = open(path, 'rb')
+        for key in keys:
+            _, offset, length = self._segment_index[key]
+            fd.seek(offset)
+            self._append_segment(key, fd.read(length))
+        fd.close()
+        os.remove(path)
+        self._pending_sync.discard(path)
+        del self._segment_bytes[path]
+        del self._segment_dead[path]
+
+    def _write_segment(self, key, data):
+        """Writes data packed in the current segment file, compacting the segment
+        which held the previous version of key if needed
+
+        Args:
+            key (String): the key to write
+            data (bytes): the data to write at key
+        """
+        path = self._discard_packed(key)
+        self._append_segment(key, data)
+        self._maybe_compact(path)
 
     def _read_proxy(self, key, update=False, **kwargs):
-        fd = open('{0}/{1}'.format(self.bucketdir.name, key), 'rb')
+        packed = self._segment_index.get(key)
+        if packed is not None:
+            path, offset, length = packed
+            fd = open(path, 'rb')
+            fd.seek(offset)
+            data = fd.read(length)
+            fd.close()
+            return StoreResult(success=True, data=data)
+        fd = open(self._filepath(key), 'rb')
         data = fd.read()
         fd.close()
         res = StoreResult(success=True, data=data)
         return res
 
+    def get(self, key):
+        try:
+            return self._read_proxy(key).data
+        except OSError:
+            return None
+
     def _write_proxy(self, key, data, **kwargs):
-        filepath = '{0}/{1}'.format(self.bucketdir.name, key)
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        filepath = self._filepath(key)
+        if 0 < self.pack_threshold and len(data) <= self.pack_threshold:
+            self._write_segment(key, data)
+            if os.path.dirname(filepath) in self._dirs and os.path.exists(filepath):
+                os.remove(filepath)
+            return StoreResult(success=True)
+        self._maybe_compact(self._discard_packed(key))
+        self._makedirs(os.path.dirname(filepath))
         fd = open(filepath, 'w+b')
         fd.write(data)
+        self._sync_fd(fd)
         fd.close()
         res = StoreResult(success=True)
         return res
 
     def _delete_proxy(self, key):
-        filepath = '{0}/{1}'.format(self.bucketdir.name, key)
+        path = self._discard_packed(key)
+        if path is not None:
+            self._maybe_compact(path)
+            return StoreResult(success=True)
+        filepath = self._filepath(key)
         os.remove(filepath)
         res = StoreResult(success=True)
         return res
@@ -3,8 +3,8 @@ from setuptools import setup
 setup(
     name='cached_stores_factory',
     version='0.0.1',
-    packages=['cached_stores_factory', 'cached_stores_factory.caches', 'cached_stores_factory.factories', 
-    'cached_stores_factory.store_results', 'cached_stores_factory.stores'],
+    packages=['cached_stores_factory', 'cached_stores_factory.admissions', 'cached_stores_factory.caches', 'cached_stores_factory.channels', 'cached_stores_factory.factories', 
+    'cached_stores_factory.simulation', 'cached_stores_factory.store_results', 'cached_stores_factory.stores'],
     url='',
     license='',
     author='Matteo Ferrabone',